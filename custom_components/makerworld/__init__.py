@@ -2,30 +2,89 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from dataclasses import dataclass
 from datetime import timedelta
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.ssl import get_default_context
 
-from .const import CONF_COOKIE, DEFAULT_SCAN_INTERVAL, DOMAIN, PLATFORMS
+from .const import (
+    CONF_COOKIE,
+    CONF_USER,
+    CONF_USER_AGENT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_UA,
+    DEFAULT_UA_HEADERS,
+    MODEL_FETCH_CONCURRENCY,
+    PLATFORMS,
+)
 from .coordinator import MakerWorldDataUpdateCoordinator
+from .entity import device_info_for
+
+
+@dataclass(slots=True)
+class MakerWorldRuntimeData:
+    """Per config entry objects shared by all platforms."""
+
+    coordinator: MakerWorldDataUpdateCoordinator
+    session: aiohttp.ClientSession
+    device_info: DeviceInfo
+    user: str
+
+
+def _all_entities_disabled(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Return True if the entry has registered entities and all are disabled."""
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    return bool(entities) and all(entity.disabled for entity in entities)
+
+
+def _create_session(entry: ConfigEntry) -> aiohttp.ClientSession:
+    """Create a session dedicated to makerworld.com.
+
+    All requests go to a single host, so a small pool with a long DNS cache
+    and keep-alive keeps the TLS connection warm between polls instead of
+    sharing Home Assistant's general purpose pool.
+    """
+    connector = aiohttp.TCPConnector(
+        ssl=get_default_context(),
+        # One pooled connection per concurrent model fetch, all to one host.
+        limit=MODEL_FETCH_CONCURRENCY,
+        limit_per_host=MODEL_FETCH_CONCURRENCY,
+        ttl_dns_cache=3600,
+        keepalive_timeout=75,
+    )
+    user_agent = entry.data.get(CONF_USER_AGENT, DEFAULT_UA)
+    headers = DEFAULT_UA_HEADERS if user_agent == DEFAULT_UA else {"User-Agent": user_agent}
+    # The User-Agent is sent as a session default header, not per request.
+    return aiohttp.ClientSession(connector=connector, headers=headers)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MakerWorld from a config entry."""
     # Migration: cookie used to be stored in options; keep one source of truth in entry data.
     if CONF_COOKIE in entry.options:
-        new_data = dict(entry.data)
-        opt_cookie = entry.options.get(CONF_COOKIE)
-        if isinstance(opt_cookie, str) and opt_cookie.strip():
-            new_data[CONF_COOKIE] = opt_cookie
-        new_options = dict(entry.options)
-        new_options.pop(CONF_COOKIE, None)
-        hass.config_entries.async_update_entry(entry, data=new_data, options=new_options)
+        opt_cookie = entry.options[CONF_COOKIE]
+        new_options = {k: v for k, v in entry.options.items() if k != CONF_COOKIE}
+        if (
+            isinstance(opt_cookie, str)
+            and opt_cookie.strip()
+            and opt_cookie != entry.data.get(CONF_COOKIE)
+        ):
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_COOKIE: opt_cookie}, options=new_options
+            )
+        else:
+            hass.config_entries.async_update_entry(entry, options=new_options)
 
-    session = async_get_clientsession(hass)
+    session = _create_session(entry)
 
     coordinator: DataUpdateCoordinator = MakerWorldDataUpdateCoordinator(
         hass,
@@ -34,11 +93,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         options=entry.options,
         update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
     )
-    await coordinator.async_config_entry_first_refresh()
+    user = sys.intern(entry.data[CONF_USER].lstrip("@"))
+    device_info = device_info_for(user)
+    entry.runtime_data = MakerWorldRuntimeData(
+        coordinator=coordinator, session=session, device_info=device_info, user=user
+    )
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    async def _async_shutdown(_event: Event) -> None:
+        await coordinator.async_shutdown()
+        # Closing the session aborts a MakerWorld request that is still in flight.
+        await session.close()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    )
+
+    if _all_entities_disabled(hass, entry):
+        # Nothing would consume the data; stay idle until an entity is added.
+        coordinator.async_set_idle()
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        return True
+
+    # Entities pick up data through the coordinator, so register the platforms
+    # while the first (slow) MakerWorld fetch is still in flight.
+    refresh_result, forward_result = await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+    if isinstance(refresh_result, BaseException):
+        if not isinstance(forward_result, BaseException):
+            await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        await session.close()
+        raise refresh_result
+    if isinstance(forward_result, BaseException):
+        await session.close()
+        raise forward_result
     return True
 
 
@@ -46,5 +136,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        # Only stop polling once the entities are gone; if the unload failed
+        # they still need a live coordinator.
+        await entry.runtime_data.coordinator.async_shutdown()
+        await entry.runtime_data.session.close()
     return unload_ok
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Optional
 
 from homeassistant.components.binary_sensor import (
@@ -12,100 +13,80 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_USER, DOMAIN
+from . import MakerWorldRuntimeData
 from .coordinator import MakerWorldDataUpdateCoordinator
+from .entity import MakerWorldEntity
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class MakerWorldBinarySensorDescription(BinarySensorEntityDescription):
     """Description of a MakerWorld binary sensor."""
 
     data_key: str = ""
     permission_key: Optional[str] = None
+    diagnostics_field: Optional[str] = None
+
+
+# (entity key suffix, bannedPermission key)
+_BANNED_PERMISSIONS = (
+    ("comment", "comment"),
+    ("community", "community"),
+    ("design_notify", "designNotify"),
+    ("private_msg", "privateMsg"),
+    ("redeem", "redeem"),
+    ("upload", "upload"),
+    ("whole", "whole"),
+)
 
-
-BANNED_PERMISSION_SENSORS = [
-    MakerWorldBinarySensorDescription(
-        key="makerworld_banned_comment",
-        name="Banned Comment",
-        data_key="Diagnostics",
-        permission_key="comment",
-    ),
-    MakerWorldBinarySensorDescription(
-        key="makerworld_banned_community",
-        name="Banned Community",
-        data_key="Diagnostics",
-        permission_key="community",
-    ),
-    MakerWorldBinarySensorDescription(
-        key="makerworld_banned_design_notify",
-        name="Banned Design Notify",
-        data_key="Diagnostics",
-        permission_key="designNotify",
-    ),
-    MakerWorldBinarySensorDescription(
-        key="makerworld_banned_private_msg",
-        name="Banned Private Msg",
-        data_key="Diagnostics",
-        permission_key="privateMsg",
-    ),
-    MakerWorldBinarySensorDescription(
-        key="makerworld_banned_redeem",
-        name="Banned Redeem",
-        data_key="Diagnostics",
-        permission_key="redeem",
-    ),
-    MakerWorldBinarySensorDescription(
-        key="makerworld_banned_upload",
-        name="Banned Upload",
-        data_key="Diagnostics",
-        permission_key="upload",
-    ),
+BANNED_PERMISSION_SENSORS = tuple(
     MakerWorldBinarySensorDescription(
-        key="makerworld_banned_whole",
-        name="Banned Whole",
-        data_key="Diagnostics",
-        permission_key="whole",
-    ),
-]
+        key=f"makerworld_banned_{suffix}",
+        name=f"Banned {suffix.replace('_', ' ').title()}",
+        data_key="BannedPermissions",
+        permission_key=permission,
+    )
+    for suffix, permission in _BANNED_PERMISSIONS
+)
 
-OTHER_BINARY_SENSORS = [
+OTHER_BINARY_SENSORS = (
     MakerWorldBinarySensorDescription(
         key="makerworld_verified",
         name="Verified",
         data_key="Diagnostics",
+        diagnostics_field="certificated",
     ),
     MakerWorldBinarySensorDescription(
         key="makerworld_commercial_licence",
         name="Commercial Licence",
         data_key="Diagnostics",
+        diagnostics_field="canSubscribeCommercialLicense",
     ),
-]
+)
 
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
     """Set up MakerWorld binary sensors based on a config entry."""
-    coordinator: MakerWorldDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    user = entry.data[CONF_USER].lstrip("@")
-
-    entities = [
-        MakerWorldBannedPermissionBinarySensor(coordinator, description, user)
-        for description in BANNED_PERMISSION_SENSORS
-    ]
-    entities.extend(
-        [MakerWorldFlagBinarySensor(coordinator, description, user) for description in OTHER_BINARY_SENSORS]
+    data: MakerWorldRuntimeData = entry.runtime_data
+    coordinator, user, device_info = data.coordinator, data.user, data.device_info
+
+    async_add_entities(
+        chain(
+            (
+                MakerWorldBannedPermissionBinarySensor(coordinator, description, user, device_info)
+                for description in BANNED_PERMISSION_SENSORS
+            ),
+            (
+                MakerWorldFlagBinarySensor(coordinator, description, user, device_info)
+                for description in OTHER_BINARY_SENSORS
+            ),
+        )
     )
 
-    async_add_entities(entities)
-
 
-class MakerWorldBannedPermissionBinarySensor(
-    CoordinatorEntity[MakerWorldDataUpdateCoordinator], BinarySensorEntity
-):
+class MakerWorldBannedPermissionBinarySensor(MakerWorldEntity, BinarySensorEntity):
     """Binary sensor for a banned permission flag."""
 
     entity_description: MakerWorldBinarySensorDescription
@@ -115,38 +96,23 @@ class MakerWorldBannedPermissionBinarySensor(
         coordinator: MakerWorldDataUpdateCoordinator,
         description: MakerWorldBinarySensorDescription,
         user: str,
+        device_info: DeviceInfo,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, user, device_info, description.key, context=description.data_key
+        )
         self.entity_description = description
-        self._user = user
-        self._attr_unique_id = f"{user}_{description.key}"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, user)},
-            manufacturer="mplinuxgeek",
-            name=f"MakerWorld Stats ({user})",
-            model="MakerWorld Stats",
-            configuration_url=f"https://makerworld.com/@{user}",
-        )
 
     @property
     def is_on(self) -> bool | None:
         data = self.coordinator.data or {}
-        diagnostics = data.get(self.entity_description.data_key)
-        if not isinstance(diagnostics, dict):
-            return None
-        banned = diagnostics.get("bannedPermission")
-        if not isinstance(banned, dict):
-            return None
-        value = banned.get(self.entity_description.permission_key)
-        if isinstance(value, bool):
-            return value
-        return None
+        return data.get(self.entity_description.data_key, {}).get(
+            self.entity_description.permission_key
+        )
 
 
-class MakerWorldFlagBinarySensor(
-    CoordinatorEntity[MakerWorldDataUpdateCoordinator], BinarySensorEntity
-):
+class MakerWorldFlagBinarySensor(MakerWorldEntity, BinarySensorEntity):
     """Binary sensor for profile flags."""
 
     entity_description: MakerWorldBinarySensorDescription
@@ -156,18 +122,12 @@ class MakerWorldFlagBinarySensor(
         coordinator: MakerWorldDataUpdateCoordinator,
         description: MakerWorldBinarySensorDescription,
         user: str,
+        device_info: DeviceInfo,
     ) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._user = user
-        self._attr_unique_id = f"{user}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, user)},
-            manufacturer="mplinuxgeek",
-            name=f"MakerWorld Stats ({user})",
-            model="MakerWorld Stats",
-            configuration_url=f"https://makerworld.com/@{user}",
+        super().__init__(
+            coordinator, user, device_info, description.key, context=description.data_key
         )
+        self.entity_description = description
 
     @property
     def is_on(self) -> bool | None:
@@ -175,10 +135,7 @@ class MakerWorldFlagBinarySensor(
         diagnostics = data.get(self.entity_description.data_key)
         if not isinstance(diagnostics, dict):
             return None
-        if self.entity_description.key == "makerworld_verified":
-            value = diagnostics.get("certificated")
-        else:
-            value = diagnostics.get("canSubscribeCommercialLicense")
+        value = diagnostics.get(self.entity_description.diagnostics_field)
         if isinstance(value, bool):
             return value
         return None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -18,6 +20,33 @@ from .const import (
     DOMAIN,
 )
 
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USER): str,
+        vol.Required(CONF_COOKIE): str,
+        vol.Optional(CONF_USER_AGENT, default=DEFAULT_UA): str,
+    }
+)
+
+
+# Pre-filled per entry with add_suggested_values_to_schema.
+_RECONFIGURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COOKIE): str,
+        vol.Optional(CONF_USER_AGENT, default=DEFAULT_UA): str,
+    }
+)
+
+
+@lru_cache(maxsize=32)
+def _options_schema(current_max: int) -> vol.Schema:
+    """Return the options schema pre-filled with the current max models."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_MAX_MODELS, default=current_max): vol.Coerce(int),
+        }
+    )
+
 
 class MakerWorldConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for MakerWorld."""
@@ -39,15 +68,7 @@ class MakerWorldConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
             return self.async_create_entry(title=f"MakerWorld {user}", data=data)
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_USER): str,
-                vol.Required(CONF_COOKIE): str,
-                vol.Optional(CONF_USER_AGENT, default=DEFAULT_UA): str,
-            }
-        )
-
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA, errors=errors)
 
     async def async_step_reconfigure(self, user_input=None) -> FlowResult:
         """Handle reconfiguration from the integration/device configure action."""
@@ -63,18 +84,7 @@ class MakerWorldConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.hass.config_entries.async_update_entry(entry, data=new_data)
             return self.async_abort(reason="reconfigure_successful")
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_COOKIE,
-                    default=entry.data.get(CONF_COOKIE, ""),
-                ): str,
-                vol.Optional(
-                    CONF_USER_AGENT,
-                    default=entry.data.get(CONF_USER_AGENT, DEFAULT_UA),
-                ): str,
-            }
-        )
+        schema = self.add_suggested_values_to_schema(_RECONFIGURE_SCHEMA, entry.data)
         return self.async_show_form(step_id="reconfigure", data_schema=schema, errors=errors)
 
     @staticmethod
@@ -95,9 +105,5 @@ class MakerWorldOptionsFlowHandler(config_entries.OptionsFlow):
 
         current_max = self._entry.options.get(CONF_MAX_MODELS, DEFAULT_MAX_MODELS)
 
-        schema = vol.Schema(
-            {
-                vol.Optional(CONF_MAX_MODELS, default=current_max): vol.Coerce(int),
-            }
-        )
+        schema = _options_schema(current_max)
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -7,13 +7,16 @@ CONF_COOKIE = "cookie"
 CONF_USER_AGENT = "user_agent"
 CONF_MAX_MODELS = "max_models"
 
-DEFAULT_UA = (
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/120.0.0.0 Safari/537.36"
-)
+DEFAULT_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+DEFAULT_UA_HEADERS = {"User-Agent": DEFAULT_UA}
 
 DEFAULT_MAX_MODELS = 0
 DEFAULT_SCAN_INTERVAL = 3600
+# Upper bound for the adaptive poll interval while the profile is unchanged.
+MAX_SCAN_INTERVAL = 6 * 3600
+# Model metrics cost one request per model; refetch them at most this often.
+MODELS_TTL = 6 * 3600
+# Model pages fetched in parallel during a refresh.
+MODEL_FETCH_CONCURRENCY = 4
 
-PLATFORMS = ["sensor", "binary_sensor", "button"]
+PLATFORMS = ("sensor", "binary_sensor", "button")
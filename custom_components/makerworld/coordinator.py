@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass
+from datetime import timedelta
+from operator import attrgetter
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 
 import async_timeout
 from aiohttp import ClientResponseError
 from bs4 import BeautifulSoup
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_COOKIE,
@@ -23,10 +30,31 @@ from .const import (
     DEFAULT_MAX_MODELS,
     DEFAULT_UA,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MODEL_FETCH_CONCURRENCY,
+    MODELS_TTL,
 )
 
-MODEL_URL_RE = re.compile(r"^/en/models/(\d+)-([^/?#]+)$")
+HREF_MODEL_RE = re.compile(rb'href="/en/models/(\d+)-([^"/?#]+)"')
+NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
 MODEL_METRIC_KEYS = ["likeCount", "downloadCount", "printCount", "boost"]
+_MODEL_METRIC_KEYS_SET = frozenset(MODEL_METRIC_KEYS)
+# title (3) + slug (2) + id (2) + one point per metric key
+_MAX_MODEL_SCORE = 3 + 2 + 2 + len(MODEL_METRIC_KEYS)
+# Data keys backed by the upload page and per-model page fetches.
+MODEL_DATA_KEYS = frozenset({"Models", "Top"})
+# Bytes of an error response decoded for Cloudflare detection and logging.
+_ERROR_BODY_PREVIEW = 64 * 1024
+# _deep_get paths, pre-split so lookups don't allocate per call.
+_PATH_PAGE_PROPS = ("props", "pageProps")
+_PATH_USER_INFO = ("props", "pageProps", "userInfo")
+_PATH_SUMMARY_POINTS = ("props", "pageProps", "summary", "Points")
+_PATH_MW_DOWNLOADS = ("MWCount", "myDesignDownloadCount")
+_PATH_MW_PRINTS = ("MWCount", "myDesignPrintCount")
+_PATH_MW_DESIGNS = ("MWCount", "designCount")
+_COOKIE_STRIP = str.maketrans("", "", "\r\n\t")
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -34,7 +62,7 @@ def _normalise_cookie(raw: str) -> str:
     cookie = raw or ""
     if cookie.lower().startswith("cookie:"):
         cookie = cookie.split(":", 1)[1]
-    return cookie.strip().replace("\r", "").replace("\n", "").replace("\t", "")
+    return cookie.strip().translate(_COOKIE_STRIP)
 
 
 def _compact_snippet(text: str, max_len: int = 300) -> str:
@@ -69,9 +97,9 @@ def _is_cloudflare_challenge(
     )
 
 
-def _deep_get(d: Dict[str, Any], path: str, default: Any = None) -> Any:
+def _deep_get(d: Dict[str, Any], path: Tuple[str, ...], default: Any = None) -> Any:
     cur: Any = d
-    for key in path.split("."):
+    for key in path:
         if isinstance(cur, dict) and key in cur:
             cur = cur[key]
         else:
@@ -80,61 +108,123 @@ def _deep_get(d: Dict[str, Any], path: str, default: Any = None) -> Any:
 
 
 def _iter_dicts(obj: Any) -> Iterable[Dict[str, Any]]:
-    if isinstance(obj, dict):
-        yield obj
-        for v in obj.values():
-            yield from _iter_dicts(v)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from _iter_dicts(item)
+    """Yield every dict in a JSON tree, depth-first in document order."""
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        cur = pop()
+        if isinstance(cur, dict):
+            yield cur
+            # Push children reversed so they pop in their original order.
+            extend(reversed(cur.values()))
+        elif isinstance(cur, list):
+            extend(reversed(cur))
 
 
 def _coerce_int(x: Any) -> Optional[int]:
-    if isinstance(x, int):
+    if type(x) is int:
         return x
-    if isinstance(x, str) and x.isdigit():
-        return int(x)
+    if type(x) is str:
+        try:
+            return int(x)
+        except ValueError:
+            return None
     return None
 
 
 def _model_ref_from_dict(d: Dict[str, Any]) -> Optional[Tuple[int, str, Optional[str]]]:
-    mid = d.get("id") if isinstance(d.get("id"), int) else None
-    slug = d.get("slug") if isinstance(d.get("slug"), str) else None
-    title = d.get("title") if isinstance(d.get("title"), str) else None
-    if mid and slug:
-        return (mid, slug, title)
-    return None
+    mid = d.get("id")
+    slug = d.get("slug")
+    if type(mid) is not int or type(slug) is not str or not mid or not slug:
+        return None
+    title = d.get("title")
+    return (mid, slug, title if type(title) is str else None)
+
+
+def _parse_next_data(body: bytes, url: str) -> Dict[str, Any]:
+    """Parse __NEXT_DATA__ from raw page bytes.
+
+    The JSON is sliced straight out of the bytes and parsed without a str
+    decode; a DOM is only built if the regex misses.
+    """
+    match = NEXT_DATA_RE.search(body)
+    if match:
+        payload = match.group(1)
+    else:
+        node = BeautifulSoup(body, "html.parser").find("script", id="__NEXT_DATA__")
+        if not node or not node.string:
+            raise UpdateFailed(f"__NEXT_DATA__ not found for {url}")
+        # orjson rejects str subclasses such as bs4's NavigableString.
+        payload = str(node.string)
+    try:
+        return json_loads(payload)
+    except ValueError as err:
+        raise UpdateFailed(f"Invalid __NEXT_DATA__ for {url}: {err}") from err
 
 
-def _collect_model_refs_from_upload_html(html: str) -> Set[Tuple[int, str]]:
-    soup = BeautifulSoup(html, "html.parser")
-    refs: Set[Tuple[int, str]] = set()
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        m = MODEL_URL_RE.match(href)
-        if m:
-            refs.add((int(m.group(1)), m.group(2)))
-    return refs
+def _collect_model_refs_from_upload_html(html: bytes) -> Set[Tuple[int, str]]:
+    return {
+        (int(m.group(1)), m.group(2).decode())
+        for m in HREF_MODEL_RE.finditer(html)
+    }
 
 
 def _collect_model_refs_from_next_data(next_data: Dict[str, Any]) -> Dict[Tuple[int, str], Optional[str]]:
     found: Dict[Tuple[int, str], Optional[str]] = {}
+    set_ref = found.__setitem__
+    ref_from_dict = _model_ref_from_dict
     for d in _iter_dicts(next_data):
-        ref = _model_ref_from_dict(d)
+        ref = ref_from_dict(d)
         if ref:
             mid, slug, title = ref
-            found[(mid, slug)] = title
+            set_ref((mid, slug), title)
     return found
 
 
+def _collect_upload_refs(html: bytes, url: str) -> Dict[Tuple[int, str], Optional[str]]:
+    """Merge the model links on an upload page with the refs in its __NEXT_DATA__."""
+    refs_html = _collect_model_refs_from_upload_html(html)
+    try:
+        refs_nd = _collect_model_refs_from_next_data(_parse_next_data(html, url))
+    except UpdateFailed as err:
+        # The links alone are still enough to find the models.
+        _LOGGER.debug("Upload page __NEXT_DATA__ unusable, using links only: %s", err)
+        refs_nd = {}
+    _LOGGER.debug(
+        "Upload refs extracted: html=%s next_data=%s",
+        len(refs_html),
+        len(refs_nd),
+    )
+
+    merged: Dict[Tuple[int, str], Optional[str]] = dict(refs_nd)
+    for mid, slug in refs_html:
+        merged.setdefault((mid, slug), None)
+    return merged
+
+
+def _data_digest(data: Dict[str, Any]) -> bytes:
+    """Stable digest of refreshed data, ignoring the refresh timestamp."""
+    payload = json.dumps(
+        {k: v for k, v in data.items() if k != "last_update"},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=8).digest()
+
+
 def _build_model_url(mid: int, slug: str) -> str:
     return f"https://makerworld.com/en/models/{mid}-{slug}"
 
 
 def _best_model_info(next_data: Dict[str, Any]) -> Dict[str, Any]:
+    # Page data lives under props.pageProps; the rest of __NEXT_DATA__ is
+    # router/build metadata, so start (and stay) there when it exists.
+    page_props = _deep_get(next_data, _PATH_PAGE_PROPS)
+    root = page_props if isinstance(page_props, dict) else next_data
     best_score = 0
     best: Dict[str, Any] = {}
-    for d in _iter_dicts(next_data):
+    for d in _iter_dicts(root):
         score = 0
         if isinstance(d.get("title"), str):
             score += 3
@@ -142,32 +232,54 @@ def _best_model_info(next_data: Dict[str, Any]) -> Dict[str, Any]:
             score += 2
         if isinstance(d.get("id"), int) or isinstance(d.get("modelId"), int):
             score += 2
-        score += sum(1 for k in MODEL_METRIC_KEYS if k in d)
+        score += len(d.keys() & _MODEL_METRIC_KEYS_SET)
         if score > best_score:
+            if score == _MAX_MODEL_SCORE:
+                return d
             best_score = score
             best = d
     return best
 
 
-def _top_by(models: List[Dict[str, Any]], metric: str) -> Optional[Dict[str, Any]]:
-    best = None
-    best_val: Optional[int] = None
+@dataclass(slots=True)
+class ModelRecord:
+    """Metrics scraped from one model page; a metric is None if missing."""
 
-    for model in models:
-        v = model.get("metrics", {}).get(metric)
-        if isinstance(v, int):
-            if best_val is None or v > best_val:
-                best_val = v
-                best = model
+    id: int
+    slug: str
+    url: str
+    title: Optional[str]
+    likeCount: Optional[int] = None
+    downloadCount: Optional[int] = None
+    printCount: Optional[int] = None
+    boost: Optional[int] = None
 
-    if not best:
-        return None
+
+# (Top key, ranking metric)
+_TOP_METRICS = (
+    ("Most Liked Model", "likeCount"),
+    ("Most Downloaded Model", "downloadCount"),
+    ("Most Printed Model", "printCount"),
+)
+_get_top_metrics = attrgetter(*(metric for _, metric in _TOP_METRICS))
+
+
+def _top_models(models: List[ModelRecord]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Pick the top model for every ranking metric in one pass."""
+    best: List[Optional[ModelRecord]] = [None] * len(_TOP_METRICS)
+    best_val: List[int] = [0] * len(_TOP_METRICS)
+
+    for model in models:
+        for i, v in enumerate(_get_top_metrics(model)):
+            if v is not None and (best[i] is None or v > best_val[i]):
+                best[i] = model
+                best_val[i] = v
 
     return {
-        "id": best.get("id"),
-        "title": best.get("title"),
-        "url": best.get("url"),
-        metric: best_val,
+        top_key: None
+        if model is None
+        else {"id": model.id, "title": model.title, "url": model.url, metric: value}
+        for (top_key, metric), model, value in zip(_TOP_METRICS, best, best_val)
     }
 
 
@@ -190,10 +302,31 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         )
         self._session = session
         self._user = config[CONF_USER].lstrip("@")
+        # URL candidates depend only on the user; build them once.
+        self._profile_urls = (
+            f"https://makerworld.com/en/@{self._user}",
+            f"https://makerworld.com/@{self._user}",
+        )
+        self._upload_urls = (
+            f"https://makerworld.com/en/@{self._user}/upload",
+            f"https://makerworld.com/@{self._user}/upload",
+        )
         self._cookie = _normalise_cookie(config.get(CONF_COOKIE, ""))
         self._user_agent = config.get(CONF_USER_AGENT, DEFAULT_UA)
         self._max_models = options.get(CONF_MAX_MODELS, DEFAULT_MAX_MODELS)
         self._last_update = None
+        self._base_interval = update_interval
+        self._last_digest: Optional[bytes] = None
+        self._unchanged_streak = 0
+        # monotonic() timestamps of the last successful fetch per data group.
+        self._fetched_at: Dict[str, float] = {}
+        self._idle = False
+        # HTTP validators (ETag, Last-Modified) and parsed __NEXT_DATA__ for
+        # pages fetched with conditional requests.
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._next_data_cache: Dict[str, Dict[str, Any]] = {}
+        # Parsed model metrics per (id, slug), revalidated via the page's validators.
+        self._model_cache: Dict[Tuple[int, str], ModelRecord] = {}
         _LOGGER.debug(
             "MakerWorld coordinator init: user=%s cookie=%s",
             self._user,
@@ -204,12 +337,75 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     def last_update(self):
         return self._last_update
 
+    @callback
+    def async_set_idle(self) -> None:
+        """Hold off all polling until an entity subscribes."""
+        self._idle = True
+        self.update_interval = None
+
+    @callback
+    def async_wake(self) -> None:
+        """Start polling if the coordinator was left idle at setup."""
+        if not self._idle:
+            return
+        self._idle = False
+        self.update_interval = self._base_interval
+        self.hass.async_create_task(self.async_refresh())
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Only schedule the next poll while entities are listening."""
+        if not self._listeners:
+            return
+        super()._schedule_refresh()
+
+    def _models_wanted(self) -> bool:
+        """Return True if the model fetches have any consumer.
+
+        Entities register their data key as listener context. Before the
+        first refresh no entity has subscribed yet, so always fetch then.
+        """
+        if self.data is None:
+            return True
+        return not MODEL_DATA_KEYS.isdisjoint(self.async_contexts())
+
+    def _is_stale(self, group: str, ttl: float) -> bool:
+        """Return True if a data group has never been fetched or has expired."""
+        fetched_at = self._fetched_at.get(group)
+        return fetched_at is None or monotonic() - fetched_at > ttl
+
+    @callback
+    def async_invalidate_all(self) -> None:
+        """Mark every data group stale so the next refresh refetches it."""
+        self._fetched_at.clear()
+
+    def _adapt_update_interval(self, data: Dict[str, Any]) -> None:
+        """Back off polling while the profile is unchanged, reset on change."""
+        if self._base_interval is None:
+            return
+        digest = _data_digest(data)
+        if digest == self._last_digest:
+            self._unchanged_streak += 1
+        else:
+            self._unchanged_streak = 0
+        self._last_digest = digest
+
+        base = self._base_interval.total_seconds()
+        seconds = min(MAX_SCAN_INTERVAL, base * 2 ** min(self._unchanged_streak, 16))
+        interval = timedelta(seconds=max(seconds, base))
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Adjusting update interval to %s (unchanged refreshes: %s)",
+                interval,
+                self._unchanged_streak,
+            )
+            self.update_interval = interval
+
     def _build_headers(self, url: str) -> Dict[str, str]:
         """Build browser-like request headers."""
         parsed = urlparse(url)
         origin = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else "https://makerworld.com"
         return {
-            "User-Agent": self._user_agent,
             "Cookie": self._cookie,
             "Accept": (
                 "text/html,application/xhtml+xml,application/xml;q=0.9,"
@@ -228,22 +424,51 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             "Origin": origin,
         }
 
-    async def _fetch_html(self, url: str, timeout: int) -> str:
+    async def _fetch_bytes(
+        self,
+        url: str,
+        timeout: int,
+        conditional: bool = False,
+        record_validators: bool = False,
+    ) -> Optional[bytes]:
+        """Fetch a raw page body.
+
+        With ``record_validators`` set, the response's ETag/Last-Modified are
+        kept for the URL. With ``conditional`` set, those validators are sent
+        and None is returned when the server answers 304 Not Modified; only
+        ask for that when a parsed copy of the page is cached.
+        """
         headers = self._build_headers(url)
-        _LOGGER.debug(
-            "MakerWorld request start: url=%s timeout=%ss cookie=%s ua=%s",
-            url,
-            timeout,
-            _cookie_fingerprint(self._cookie),
-            self._user_agent,
-        )
+        if conditional and url in self._validators:
+            etag, last_modified = self._validators[url]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "MakerWorld request start: url=%s timeout=%ss cookie=%s ua=%s",
+                url,
+                timeout,
+                _cookie_fingerprint(self._cookie),
+                self._user_agent,
+            )
         async with async_timeout.timeout(timeout):
             async with self._session.get(url, headers=headers) as resp:
-                body = await resp.text()
+                if conditional and resp.status == 304:
+                    _LOGGER.debug("MakerWorld request not modified: url=%s", url)
+                    return None
+                body = await resp.read()
                 if resp.status >= 400:
+                    # Only the head of an error page is needed for challenge
+                    # detection and the log snippet; don't copy a large body.
+                    text = body[:_ERROR_BODY_PREVIEW].decode(
+                        resp.charset or "utf-8", errors="replace"
+                    )
                     hist = [str(h.url) for h in resp.history]
                     cloudflare_challenge = _is_cloudflare_challenge(
-                        resp.status, dict(resp.headers), body
+                        resp.status, dict(resp.headers), text
                     )
                     _LOGGER.warning(
                         (
@@ -263,7 +488,7 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                         cloudflare_challenge,
                         resp.headers.get("location"),
                         _cookie_fingerprint(self._cookie),
-                        _compact_snippet(body),
+                        _compact_snippet(text),
                     )
                     if cloudflare_challenge:
                         raise UpdateFailed(
@@ -271,25 +496,42 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                             "This requires a real browser/JavaScript flow and cannot be solved by aiohttp."
                         )
                 resp.raise_for_status()
-                _LOGGER.debug(
-                    "MakerWorld request success: request_url=%s response_url=%s status=%s body_len=%s",
-                    url,
-                    resp.url,
-                    resp.status,
-                    len(body),
-                )
+                if debug:
+                    _LOGGER.debug(
+                        "MakerWorld request success: request_url=%s response_url=%s status=%s body_len=%s",
+                        url,
+                        resp.url,
+                        resp.status,
+                        len(body),
+                    )
+                if record_validators:
+                    etag = resp.headers.get("ETag")
+                    last_modified = resp.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._validators[url] = (etag, last_modified)
+                    else:
+                        self._validators.pop(url, None)
                 return body
 
-    async def _fetch_next_data(self, url: str, timeout: int) -> Dict[str, Any]:
-        html = await self._fetch_html(url, timeout)
-        soup = BeautifulSoup(html, "html.parser")
-        node = soup.select_one("script#__NEXT_DATA__")
-        if not node or not node.string:
-            raise UpdateFailed(f"__NEXT_DATA__ not found for {url}")
-        return json.loads(node.string)
+    async def _fetch_next_data(
+        self, url: str, timeout: int, cached: bool = False
+    ) -> Dict[str, Any]:
+        """Fetch and parse __NEXT_DATA__, revalidating the cached copy if ``cached``."""
+        body = await self._fetch_bytes(
+            url,
+            timeout,
+            conditional=cached and url in self._next_data_cache,
+            record_validators=cached,
+        )
+        if body is None:
+            return self._next_data_cache[url]
+        data = _parse_next_data(body, url)
+        if cached:
+            self._next_data_cache[url] = data
+        return data
 
     async def _fetch_next_data_from_candidates(
-        self, urls: List[str], timeout: int, label: str
+        self, urls: Sequence[str], timeout: int, label: str, cached: bool = False
     ) -> Tuple[Dict[str, Any], str]:
         """Fetch __NEXT_DATA__ using the first working URL candidate."""
         last_err: Optional[Exception] = None
@@ -298,13 +540,14 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         for url in urls:
             _LOGGER.debug("Trying %s candidate URL: %s", label, url)
             try:
-                data = await self._fetch_next_data(url, timeout)
-                _LOGGER.debug(
-                    "Selected %s candidate URL: %s (top-level keys: %s)",
-                    label,
-                    url,
-                    list(data.keys()) if isinstance(data, dict) else type(data),
-                )
+                data = await self._fetch_next_data(url, timeout, cached)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Selected %s candidate URL: %s (top-level keys: %s)",
+                        label,
+                        url,
+                        list(data.keys()) if isinstance(data, dict) else type(data),
+                    )
                 return data, url
             except Exception as err:
                 last_err = err
@@ -325,8 +568,8 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         raise UpdateFailed(f"Failed to fetch {label}: {detail}") from last_err
 
     async def _fetch_html_from_candidates(
-        self, urls: List[str], timeout: int, label: str
-    ) -> Tuple[str, str]:
+        self, urls: Sequence[str], timeout: int, label: str
+    ) -> Tuple[bytes, str]:
         """Fetch HTML using the first working URL candidate."""
         last_err: Optional[Exception] = None
         attempts: List[str] = []
@@ -334,7 +577,7 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         for url in urls:
             _LOGGER.debug("Trying %s candidate URL: %s", label, url)
             try:
-                html = await self._fetch_html(url, timeout)
+                html = await self._fetch_bytes(url, timeout)
                 _LOGGER.debug(
                     "Selected %s candidate URL: %s (html_len=%s)",
                     label,
@@ -360,36 +603,94 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         slug: str,
         title_hint: Optional[str],
         timeout: int,
-    ) -> Dict[str, Any]:
+    ) -> ModelRecord:
         url = _build_model_url(mid, slug)
-        nd = await self._fetch_next_data(url, timeout)
-        info = _best_model_info(nd)
+        cached = self._model_cache.get((mid, slug))
+        body = await self._fetch_bytes(
+            url,
+            timeout,
+            conditional=cached is not None,
+            record_validators=True,
+        )
+        if body is None:
+            # 304: the page is unchanged, skip the parse and traversal too.
+            return cached
+        info = _best_model_info(_parse_next_data(body, url))
 
-        metrics: Dict[str, Any] = {}
+        get = info.get
+        metrics: Dict[str, Optional[int]] = {}
         for key in MODEL_METRIC_KEYS:
-            if key in info:
-                v = info.get(key)
-                iv = _coerce_int(v)
-                metrics[key] = iv if iv is not None else v
+            v = get(key)
+            # JSON metrics are almost always ints already; skip the call then.
+            metrics[key] = v if type(v) is int else _coerce_int(v)
+
+        title = get("title")
+        model = ModelRecord(
+            mid,
+            slug,
+            url,
+            title if isinstance(title, str) else title_hint,
+            **metrics,
+        )
+        self._model_cache[(mid, slug)] = model
+        return model
+
+    async def _async_fetch_upload_refs(
+        self, upload_urls: Sequence[str], timeout: int
+    ) -> Dict[Tuple[int, str], Optional[str]]:
+        """Collect model refs from the upload page links and its __NEXT_DATA__."""
+        # One download serves both the link sweep and __NEXT_DATA__.
+        upload_html, upload_url = await self._fetch_html_from_candidates(
+            upload_urls, timeout, "upload page"
+        )
+        return _collect_upload_refs(upload_html, upload_url)
 
-        return {
-            "id": mid,
-            "slug": slug,
-            "url": url,
-            "title": info.get("title") if isinstance(info.get("title"), str) else title_hint,
-            "metrics": metrics,
-        }
+    async def _async_fetch_top_models(
+        self, merged: Dict[Tuple[int, str], Optional[str]], timeout: int
+    ) -> Dict[str, Any]:
+        """Fetch metrics for the referenced models and pick the top ones."""
+        model_refs = list(merged.items())
+        model_refs.sort(key=lambda x: x[0][0])
+        _LOGGER.debug("Merged model refs before max_models limit: %s", len(model_refs))
+
+        if self._max_models and self._max_models > 0:
+            model_refs = model_refs[: self._max_models]
+            _LOGGER.debug(
+                "Applied max_models=%s, scanning refs=%s",
+                self._max_models,
+                len(model_refs),
+            )
+
+        # Overlap the per-model requests, but keep only a few in flight so
+        # MakerWorld's anti-abuse protection is not triggered.
+        semaphore = asyncio.Semaphore(MODEL_FETCH_CONCURRENCY)
+
+        async def fetch_one(
+            mid: int, slug: str, title: Optional[str]
+        ) -> Optional[ModelRecord]:
+            async with semaphore:
+                try:
+                    return await self._fetch_model_metrics(mid, slug, title, timeout)
+                except Exception:
+                    _LOGGER.debug("Failed model metrics fetch for id=%s slug=%s", mid, slug)
+                    return None
+
+        results = await asyncio.gather(
+            *(fetch_one(mid, slug, title) for (mid, slug), title in model_refs)
+        )
+        models: List[ModelRecord] = [model for model in results if model is not None]
+
+        # Forget models that are no longer listed (or no longer scanned).
+        for ref in self._model_cache.keys() - {ref for ref, _ in model_refs}:
+            del self._model_cache[ref]
+            self._validators.pop(_build_model_url(*ref), None)
+
+        return _top_models(models)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         try:
-            profile_urls = [
-                f"https://makerworld.com/en/@{self._user}",
-                f"https://makerworld.com/@{self._user}",
-            ]
-            upload_urls = [
-                f"https://makerworld.com/en/@{self._user}/upload",
-                f"https://makerworld.com/@{self._user}/upload",
-            ]
+            profile_urls = self._profile_urls
+            upload_urls = self._upload_urls
             timeout = 20
             _LOGGER.debug(
                 "Starting MakerWorld refresh for user='%s' profile_candidates=%s upload_candidates=%s",
@@ -398,16 +699,30 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 upload_urls,
             )
 
-            profile_nd, profile_url = await self._fetch_next_data_from_candidates(
-                profile_urls, timeout, "profile"
+            fetch_models = self._models_wanted() and self._is_stale("models", MODELS_TTL)
+            profile_fetch = self._fetch_next_data_from_candidates(
+                profile_urls, timeout, "profile", cached=True
             )
-            user_info = _deep_get(profile_nd, "props.pageProps.userInfo")
+            if fetch_models:
+                # The profile and upload pages are independent; fetch them together.
+                profile_res, upload_res = await asyncio.gather(
+                    profile_fetch,
+                    self._async_fetch_upload_refs(upload_urls, timeout),
+                    return_exceptions=True,
+                )
+                if isinstance(profile_res, BaseException):
+                    raise profile_res
+                profile_nd, profile_url = profile_res
+            else:
+                profile_nd, profile_url = await profile_fetch
+            user_info = _deep_get(profile_nd, _PATH_USER_INFO)
             if not isinstance(user_info, dict):
+                page_props = _deep_get(profile_nd, _PATH_PAGE_PROPS, {})
                 _LOGGER.debug(
                     "profile data keys under props.pageProps: %s",
-                    list(_deep_get(profile_nd, "props.pageProps", {}).keys())
-                    if isinstance(_deep_get(profile_nd, "props.pageProps", {}), dict)
-                    else type(_deep_get(profile_nd, "props.pageProps", {})),
+                    list(page_props.keys())
+                    if isinstance(page_props, dict)
+                    else type(page_props),
                 )
                 raise UpdateFailed("props.pageProps.userInfo not found")
 
@@ -415,73 +730,38 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 user_info.get("point")
                 or user_info.get("points")
                 or user_info.get("pointCount")
-                or _deep_get(profile_nd, "props.pageProps.summary.Points")
+                or _deep_get(profile_nd, _PATH_SUMMARY_POINTS)
             )
 
             summary = {
                 "Likes": user_info.get("likeCount"),
-                "Downloads": _deep_get(user_info, "MWCount.myDesignDownloadCount"),
-                "Prints": _deep_get(user_info, "MWCount.myDesignPrintCount"),
+                "Downloads": _deep_get(user_info, _PATH_MW_DOWNLOADS),
+                "Prints": _deep_get(user_info, _PATH_MW_PRINTS),
                 "Points": points,
                 "Followers": user_info.get("fanCount"),
                 "Boosts Received": user_info.get("boostGained"),
             }
 
-            refs_html: Set[Tuple[int, str]] = set()
-            refs_nd: Dict[Tuple[int, str], Optional[str]] = {}
-            try:
-                upload_html, _ = await self._fetch_html_from_candidates(
-                    upload_urls, timeout, "upload page"
-                )
-                refs_html = _collect_model_refs_from_upload_html(upload_html)
-
-                upload_nd, _ = await self._fetch_next_data_from_candidates(
-                    upload_urls, timeout, "upload data"
-                )
-                refs_nd = _collect_model_refs_from_next_data(upload_nd)
-                _LOGGER.debug(
-                    "Upload refs extracted: html=%s next_data=%s",
-                    len(refs_html),
-                    len(refs_nd),
-                )
-            except UpdateFailed as err:
-                _LOGGER.warning(
-                    "Failed to load upload data for user '%s'; continuing with profile summary only. "
-                    "Profile URL: %s. Error: %s",
-                    self._user,
-                    profile_url,
-                    err,
-                )
-
-            merged: Dict[Tuple[int, str], Optional[str]] = dict(refs_nd)
-            for mid, slug in refs_html:
-                merged.setdefault((mid, slug), None)
-
-            model_refs = list(merged.items())
-            model_refs.sort(key=lambda x: x[0][0])
-            _LOGGER.debug("Merged model refs before max_models limit: %s", len(model_refs))
-
-            if self._max_models and self._max_models > 0:
-                model_refs = model_refs[: self._max_models]
-                _LOGGER.debug(
-                    "Applied max_models=%s, scanning refs=%s",
-                    self._max_models,
-                    len(model_refs),
-                )
-
-            models: List[Dict[str, Any]] = []
-            for (mid, slug), title in model_refs:
-                try:
-                    models.append(await self._fetch_model_metrics(mid, slug, title, timeout))
-                except Exception:
-                    _LOGGER.debug("Failed model metrics fetch for id=%s slug=%s", mid, slug)
-                    continue
-
-            top = {
-                "Most Liked Model": _top_by(models, "likeCount"),
-                "Most Downloaded Model": _top_by(models, "downloadCount"),
-                "Most Printed Model": _top_by(models, "printCount"),
-            }
+            if fetch_models:
+                if isinstance(upload_res, UpdateFailed):
+                    _LOGGER.warning(
+                        "Failed to load upload data for user '%s'; continuing with profile summary only. "
+                        "Profile URL: %s. Error: %s",
+                        self._user,
+                        profile_url,
+                        upload_res,
+                    )
+                    merged = {}
+                elif isinstance(upload_res, BaseException):
+                    raise upload_res
+                else:
+                    merged = upload_res
+                model_count = len(merged)
+                top = await self._async_fetch_top_models(merged, timeout)
+            else:
+                prev = self.data or {}
+                model_count, top = prev.get("Models"), prev.get("Top", {})
+                _LOGGER.debug("Model data not wanted or still fresh; skipping upload/model fetches")
 
             diagnostics = {
                 "bannedPermission": user_info.get("bannedPermission"),
@@ -493,7 +773,7 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 "canSubscribeCommercialLicense": user_info.get(
                     "canSubscribeCommercialLicense"
                 ),
-                "designCount": _deep_get(user_info, "MWCount.designCount"),
+                "designCount": _deep_get(user_info, _PATH_MW_DESIGNS),
                 "collectionCount": user_info.get("collectionCount"),
                 "downloadCount": user_info.get("downloadCount"),
                 "followCount": user_info.get("followCount"),
@@ -501,17 +781,31 @@ class MakerWorldDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 "winContestTimes": user_info.get("winContestTimes"),
             }
 
+            # Validate the banned permission flags once here so entity reads are a plain lookup.
+            banned = user_info.get("bannedPermission")
+            banned_permissions = (
+                {k: v for k, v in banned.items() if isinstance(v, bool)}
+                if isinstance(banned, dict)
+                else {}
+            )
+
             last_update_val = dt_util.utcnow()
             _LOGGER.debug("Setting last_update to: %s (type: %s)", last_update_val, type(last_update_val))
             
             data = {
                 **summary,
                 "Top": top,
-                "Models": len(merged),
+                "Models": model_count,
                 "Diagnostics": diagnostics,
+                "BannedPermissions": banned_permissions,
                 "last_update": last_update_val,
             }
             _LOGGER.debug("Coordinator data keys: %s", data.keys())
+            if fetch_models and not isinstance(upload_res, BaseException):
+                # Only mark the models fresh once the whole refresh has
+                # succeeded, so a failed one is retried on the next poll.
+                self._fetched_at["models"] = monotonic()
+            self._adapt_update_interval(data)
             return data
         except Exception as err:
             _LOGGER.exception("MakerWorld refresh failed for user '%s': %s", self._user, err)
@@ -0,0 +1,46 @@
+"""Base entity for MakerWorld."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import MakerWorldDataUpdateCoordinator
+
+
+@lru_cache(maxsize=8)
+def device_info_for(user: str) -> DeviceInfo:
+    """Return the DeviceInfo for a MakerWorld user, reused across reloads."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, user)},
+        manufacturer="mplinuxgeek",
+        name=f"MakerWorld Stats ({user})",
+        model="MakerWorld Stats",
+        configuration_url=f"https://makerworld.com/@{user}",
+    )
+
+
+class MakerWorldEntity(CoordinatorEntity[MakerWorldDataUpdateCoordinator]):
+    """Common base for MakerWorld entities."""
+
+    def __init__(
+        self,
+        coordinator: MakerWorldDataUpdateCoordinator,
+        user: str,
+        device_info: DeviceInfo,
+        key: str,
+        context: Optional[Any] = None,
+    ) -> None:
+        super().__init__(coordinator, context=context)
+        self._user = user
+        self._attr_unique_id = f"{user}_{key}"
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates and wake the coordinator if it was left idle."""
+        await super().async_added_to_hass()
+        self.coordinator.async_wake()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,10 +14,10 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_USER, DOMAIN
+from . import MakerWorldRuntimeData
 from .coordinator import MakerWorldDataUpdateCoordinator
+from .entity import MakerWorldEntity
 
 
 @dataclass
@@ -26,6 +26,7 @@ class MakerWorldSensorDescription(SensorEntityDescription):
 
     data_key: str = ""
     top_key: Optional[str] = None
+    metric_key: Optional[str] = None
 
 
 SUMMARY_SENSORS = [
@@ -86,6 +87,7 @@ TOP_SENSORS = [
         name="Most Liked Model",
         data_key="Top",
         top_key="Most Liked Model",
+        metric_key="likeCount",
         icon="mdi:finance",
     ),
     MakerWorldSensorDescription(
@@ -93,6 +95,7 @@ TOP_SENSORS = [
         name="Most Downloaded Model",
         data_key="Top",
         top_key="Most Downloaded Model",
+        metric_key="downloadCount",
         icon="mdi:download-multiple",
     ),
     MakerWorldSensorDescription(
@@ -100,6 +103,7 @@ TOP_SENSORS = [
         name="Most Printed Model",
         data_key="Top",
         top_key="Most Printed Model",
+        metric_key="printCount",
         icon="mdi:printer-3d",
     ),
 ]
@@ -120,22 +124,64 @@ OTHER_DIAGNOSTIC_SENSORS = [
 ]
 
 
+# Reads a sensor's state or attributes from the coordinator data.
+_Reader = Callable[[Dict[str, Any]], Any]
+
+
+def _no_attributes(data: Dict[str, Any]) -> None:
+    return None
+
+
+def _data_key_reader(data_key: str) -> _Reader:
+    def read_value(data: Dict[str, Any]) -> Any:
+        return data.get(data_key)
+
+    return read_value
+
+
+def _top_model_readers(description: MakerWorldSensorDescription) -> Tuple[_Reader, _Reader]:
+    data_key = description.data_key
+    top_key = description.top_key
+    metric_key = description.metric_key
+
+    def model_for(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        top = data.get(data_key)
+        model = top.get(top_key) if isinstance(top, dict) else None
+        return model if isinstance(model, dict) else None
+
+    def read_value(data: Dict[str, Any]) -> Any:
+        model = model_for(data)
+        return model.get("title") if model is not None else None
+
+    def read_attributes(data: Dict[str, Any]) -> Dict[str, Any] | None:
+        model = model_for(data)
+        if model is None:
+            return None
+        return {
+            "title": model.get("title"),
+            "url": model.get("url"),
+            "id": model.get("id"),
+            "count": model.get(metric_key) if metric_key else None,
+        }
+
+    return read_value, read_attributes
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
     """Set up MakerWorld sensors based on a config entry."""
-    coordinator: MakerWorldDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    user = entry.data[CONF_USER].lstrip("@")
+    data: MakerWorldRuntimeData = entry.runtime_data
 
     entities = [
-        MakerWorldSensor(coordinator, description, user)
+        MakerWorldSensor(data.coordinator, description, data.user, data.device_info)
         for description in SUMMARY_SENSORS + TOP_SENSORS + OTHER_DIAGNOSTIC_SENSORS
     ]
 
     async_add_entities(entities)
 
 
-class MakerWorldSensor(CoordinatorEntity[MakerWorldDataUpdateCoordinator], SensorEntity):
+class MakerWorldSensor(MakerWorldEntity, SensorEntity):
     """Representation of a MakerWorld sensor."""
 
     entity_description: MakerWorldSensorDescription
@@ -145,97 +191,66 @@ class MakerWorldSensor(CoordinatorEntity[MakerWorldDataUpdateCoordinator], Senso
         coordinator: MakerWorldDataUpdateCoordinator,
         description: MakerWorldSensorDescription,
         user: str,
+        device_info: DeviceInfo,
     ) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._user = user
-        self._attr_unique_id = f"{user}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, user)},
-            manufacturer="mplinuxgeek",
-            name=f"MakerWorld Stats ({user})",
-            model="MakerWorld Stats",
-            configuration_url=f"https://makerworld.com/@{user}",
+        super().__init__(
+            coordinator, user, device_info, description.key, context=description.data_key
         )
+        self.entity_description = description
         if description.key == "makerworld_last_update":
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        # (coordinator data it was computed from, (state, attributes))
+        self._badges_cache: Optional[Tuple[Any, Tuple[Optional[str], Dict[str, Any] | None]]] = None
 
-    @property
-    def native_value(self) -> Any:
-        data = self.coordinator.data or {}
-        
-        if self.entity_description.key == "makerworld_last_update":
-            return data.get("last_update")
-        
-        if self.entity_description.top_key:
-            top = data.get(self.entity_description.data_key, {})
-            if not isinstance(top, dict):
-                return None
-            model = top.get(self.entity_description.top_key)
-            if not isinstance(model, dict):
-                return None
-            return model.get("title")
-
-        if self.entity_description.key == "makerworld_badges":
-            diagnostics = data.get(self.entity_description.data_key)
-            if not isinstance(diagnostics, dict):
-                return None
-            badges = diagnostics.get("badges")
-            if not isinstance(badges, list):
-                return None
-            titles = [
-                badge.get("title")
-                for badge in badges
-                if isinstance(badge, dict) and isinstance(badge.get("title"), str)
-            ]
-            return ", ".join(titles) if titles else None
+        # Pick the readers for this sensor kind once, so the state
+        # properties don't branch on the description on every write.
+        self._read_value: _Reader
+        self._read_attributes: _Reader
+        if description.top_key:
+            self._read_value, self._read_attributes = _top_model_readers(description)
+        elif description.key == "makerworld_badges":
+            self._read_value = lambda data: self._badges()[0]
+            self._read_attributes = lambda data: self._badges()[1]
+        else:
+            self._read_value = _data_key_reader(description.data_key)
+            self._read_attributes = _no_attributes
 
-        return data.get(self.entity_description.data_key)
+    def _badges(self) -> Tuple[Optional[str], Dict[str, Any] | None]:
+        """Return the badges state and attributes, once per coordinator update."""
+        data = self.coordinator.data
+        cache = self._badges_cache
+        if cache is not None and cache[0] is data:
+            return cache[1]
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any] | None:
-        data = self.coordinator.data or {}
-        if self.entity_description.key == "makerworld_badges":
-            diagnostics = data.get(self.entity_description.data_key)
-            if not isinstance(diagnostics, dict):
-                return None
+        result: Tuple[Optional[str], Dict[str, Any] | None] = (None, None)
+        diagnostics = (data or {}).get(self.entity_description.data_key)
+        if isinstance(diagnostics, dict):
             badges = diagnostics.get("badges")
-            if not isinstance(badges, list):
-                return None
-            titles = [
-                badge.get("title")
-                for badge in badges
-                if isinstance(badge, dict) and isinstance(badge.get("title"), str)
-            ]
-            return {
-                "badges": titles,
-                "verified": diagnostics.get("certificated"),
-                "commercial_licence": diagnostics.get("canSubscribeCommercialLicense"),
-            }
-
-        if not self.entity_description.top_key:
-            return None
-
-        top = data.get(self.entity_description.data_key, {})
-        if not isinstance(top, dict):
-            return None
-        model = top.get(self.entity_description.top_key)
-        if not isinstance(model, dict):
-            return None
+            if isinstance(badges, list):
+                titles = [
+                    badge.get("title")
+                    for badge in badges
+                    if isinstance(badge, dict) and isinstance(badge.get("title"), str)
+                ]
+                result = (
+                    ", ".join(titles) if titles else None,
+                    {
+                        "badges": titles,
+                        "verified": diagnostics.get("certificated"),
+                        "commercial_licence": diagnostics.get(
+                            "canSubscribeCommercialLicense"
+                        ),
+                    },
+                )
+        # Keep the data object itself: every refresh replaces it, and
+        # holding the reference means its identity can't be reused.
+        self._badges_cache = (data, result)
+        return result
 
-        metric_key = None
-        if self.entity_description.top_key == "Most Liked Model":
-            metric_key = "likeCount"
-        elif self.entity_description.top_key == "Most Downloaded Model":
-            metric_key = "downloadCount"
-        elif self.entity_description.top_key == "Most Printed Model":
-            metric_key = "printCount"
-
-        metric_value = model.get(metric_key) if metric_key else None
+    @property
+    def native_value(self) -> Any:
+        return self._read_value(self.coordinator.data or {})
 
-        return {
-            "title": model.get("title"),
-            "url": model.get("url"),
-            "id": model.get("id"),
-            "count": metric_value,
-        }
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        return self._read_attributes(self.coordinator.data or {})
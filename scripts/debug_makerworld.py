@@ -8,13 +8,44 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import hashlib
 import json
+import os
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
-
-MODEL_URL_RE = re.compile(r"^/en/models/(\d+)-([^/?#]+)$")
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    # Home Assistant ships orjson; fall back to the stdlib outside its venv.
+    from orjson import loads as _json_loads  # type: ignore
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
+try:
+    import aiohttp  # type: ignore
+except ModuleNotFoundError:
+    # Reported by _aiohttp() when a session is actually needed.
+    aiohttp = None
+
+# Matches nothing when aiohttp is missing (no request can have been made).
+_CLIENT_RESPONSE_ERROR = aiohttp.ClientResponseError if aiohttp is not None else ()
+
+HREF_MODEL_RE = re.compile(rb'href="/en/models/(\d+)-([^"/?#]+)"')
+_NEXT_DATA_RE = re.compile(rb'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
 MODEL_METRIC_KEYS = ["likeCount", "downloadCount", "printCount", "boost"]
+_MODEL_METRIC_KEYS_SET = frozenset(MODEL_METRIC_KEYS)
+# title (3) + slug (2) + id (2) + one point per metric key
+_MAX_MODEL_SCORE = 3 + 2 + 2 + len(MODEL_METRIC_KEYS)
+_COOKIE_STRIP = str.maketrans("", "", "\r\n\t")
+# _deep_get paths, pre-split so lookups don't allocate per call.
+_PATH_PAGE_PROPS = ("props", "pageProps")
+_PATH_USER_INFO = ("props", "pageProps", "userInfo")
+_PATH_SUMMARY_POINTS = ("props", "pageProps", "summary", "Points")
+_PATH_MW_DOWNLOADS = ("MWCount", "myDesignDownloadCount")
+_PATH_MW_PRINTS = ("MWCount", "myDesignPrintCount")
+_PATH_MW_DESIGNS = ("MWCount", "designCount")
 DEFAULT_UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -26,38 +57,74 @@ class ScrapeError(RuntimeError):
     """Scraping/parsing failure."""
 
 
+class _PageCache:
+    """On-disk __NEXT_DATA__ payloads with the HTTP validators they were served with."""
+
+    def __init__(self, directory: str, ttl: float) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, url: str) -> str:
+        name = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}.json")
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url), encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get("url") == url else None
+
+    def save(
+        self, url: str, etag: Optional[str], last_modified: Optional[str], payload: bytes
+    ) -> None:
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "payload": payload.decode("utf-8", errors="replace"),
+            "fetched_at": time.time(),
+        }
+        with open(self._path(url), "w", encoding="utf-8") as fh:
+            json.dump(entry, fh)
+
+
 def _aiohttp():
-    try:
-        import aiohttp  # type: ignore
-    except ModuleNotFoundError as err:
+    if aiohttp is None:
         raise ScrapeError(
             "Missing dependency 'aiohttp'. Run this from your Home Assistant venv "
             "or install aiohttp in your local Python environment."
-        ) from err
+        )
     return aiohttp
 
 
-def _beautiful_soup():
-    try:
-        from bs4 import BeautifulSoup  # type: ignore
-    except ModuleNotFoundError as err:
-        raise ScrapeError(
-            "Missing dependency 'beautifulsoup4'. Run this from your Home Assistant venv "
-            "or install beautifulsoup4 in your local Python environment."
-        ) from err
-    return BeautifulSoup
+@functools.lru_cache(maxsize=64)
+def _urls_for(user: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return the (profile, upload) URL candidates for a cleaned username."""
+    return (
+        (
+            f"https://makerworld.com/en/@{user}",
+            f"https://makerworld.com/@{user}",
+        ),
+        (
+            f"https://makerworld.com/en/@{user}/upload",
+            f"https://makerworld.com/@{user}/upload",
+        ),
+    )
 
 
 def _normalise_cookie(raw: str) -> str:
     cookie = raw or ""
     if cookie.lower().startswith("cookie:"):
         cookie = cookie.split(":", 1)[1]
-    return cookie.strip().replace("\r", "").replace("\n", "").replace("\t", "")
+    return cookie.strip().translate(_COOKIE_STRIP)
 
 
-def _deep_get(d: Dict[str, Any], path: str, default: Any = None) -> Any:
+def _deep_get(d: Dict[str, Any], path: Tuple[str, ...], default: Any = None) -> Any:
     cur: Any = d
-    for key in path.split("."):
+    for key in path:
         if isinstance(cur, dict) and key in cur:
             cur = cur[key]
         else:
@@ -66,116 +133,171 @@ def _deep_get(d: Dict[str, Any], path: str, default: Any = None) -> Any:
 
 
 def _iter_dicts(obj: Any) -> Iterable[Dict[str, Any]]:
-    if isinstance(obj, dict):
-        yield obj
-        for v in obj.values():
-            yield from _iter_dicts(v)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from _iter_dicts(item)
+    """Yield every dict in a JSON tree, depth-first in document order."""
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        cur = pop()
+        if isinstance(cur, dict):
+            yield cur
+            # Push children reversed so they pop in their original order.
+            extend(reversed(cur.values()))
+        elif isinstance(cur, list):
+            extend(reversed(cur))
 
 
 def _coerce_int(x: Any) -> Optional[int]:
-    if isinstance(x, int):
+    if type(x) is int:
         return x
-    if isinstance(x, str) and x.isdigit():
-        return int(x)
-    return None
-
-
-def _model_ref_from_dict(d: Dict[str, Any]) -> Optional[Tuple[int, str, Optional[str]]]:
-    mid = d.get("id") if isinstance(d.get("id"), int) else None
-    slug = d.get("slug") if isinstance(d.get("slug"), str) else None
-    title = d.get("title") if isinstance(d.get("title"), str) else None
-    if mid and slug:
-        return (mid, slug, title)
+    if type(x) is str:
+        try:
+            return int(x)
+        except ValueError:
+            return None
     return None
 
 
-def _collect_model_refs_from_upload_html(html: str) -> Set[Tuple[int, str]]:
-    soup = _beautiful_soup()(html, "html.parser")
-    refs: Set[Tuple[int, str]] = set()
-    for a in soup.find_all("a", href=True):
-        m = MODEL_URL_RE.match(a["href"])
-        if m:
-            refs.add((int(m.group(1)), m.group(2)))
-    return refs
+def _collect_model_refs_from_upload_html(html: bytes) -> Set[Tuple[int, str]]:
+    return {
+        (int(m.group(1)), m.group(2).decode())
+        for m in HREF_MODEL_RE.finditer(html)
+    }
 
 
 def _collect_model_refs_from_next_data(next_data: Dict[str, Any]) -> Dict[Tuple[int, str], Optional[str]]:
     found: Dict[Tuple[int, str], Optional[str]] = {}
     for d in _iter_dicts(next_data):
-        ref = _model_ref_from_dict(d)
-        if ref:
-            mid, slug, title = ref
-            found[(mid, slug)] = title
+        mid = d.get("id")
+        slug = d.get("slug")
+        if type(mid) is int and type(slug) is str and mid and slug:
+            title = d.get("title")
+            found[(mid, slug)] = title if type(title) is str else None
     return found
 
 
 def _best_model_info(next_data: Dict[str, Any]) -> Dict[str, Any]:
+    # Page data lives under props.pageProps; the rest of __NEXT_DATA__ is
+    # router/build metadata, so start (and stay) there when it exists.
+    page_props = _deep_get(next_data, _PATH_PAGE_PROPS)
+    root = page_props if isinstance(page_props, dict) else next_data
     best_score = 0
     best: Dict[str, Any] = {}
-    for d in _iter_dicts(next_data):
-        score = 0
+    for d in _iter_dicts(root):
+        score = len(d.keys() & _MODEL_METRIC_KEYS_SET)
         if isinstance(d.get("title"), str):
             score += 3
         if isinstance(d.get("slug"), str):
             score += 2
         if isinstance(d.get("id"), int) or isinstance(d.get("modelId"), int):
             score += 2
-        score += sum(1 for k in MODEL_METRIC_KEYS if k in d)
         if score > best_score:
+            if score == _MAX_MODEL_SCORE:
+                return d
             best_score = score
             best = d
     return best
 
 
-def _top_by(models: List[Dict[str, Any]], metric: str) -> Optional[Dict[str, Any]]:
-    best = None
-    best_val: Optional[int] = None
+# (Top key, ranking metric)
+_TOP_METRICS = (
+    ("Most Liked Model", "likeCount"),
+    ("Most Downloaded Model", "downloadCount"),
+    ("Most Printed Model", "printCount"),
+)
+
+
+def _top_models(models: List[Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Pick the top model for every ranking metric in one pass."""
+    best: Dict[str, Tuple[Dict[str, Any], int]] = {}
     for model in models:
-        value = model.get("metrics", {}).get(metric)
-        if isinstance(value, int):
-            if best_val is None or value > best_val:
-                best_val = value
-                best = model
-    if not best:
-        return None
-    return {
-        "id": best.get("id"),
-        "title": best.get("title"),
-        "url": best.get("url"),
-        metric: best_val,
-    }
+        metrics = model.get("metrics")
+        if not metrics:
+            continue
+        for _, metric in _TOP_METRICS:
+            value = metrics.get(metric)
+            if isinstance(value, int) and (metric not in best or value > best[metric][1]):
+                best[metric] = (model, value)
+
+    top: Dict[str, Optional[Dict[str, Any]]] = {}
+    for top_key, metric in _TOP_METRICS:
+        if metric not in best:
+            top[top_key] = None
+            continue
+        model, value = best[metric]
+        top[top_key] = {
+            "id": model.get("id"),
+            "title": model.get("title"),
+            "url": model.get("url"),
+            metric: value,
+        }
+    return top
 
 
 async def _fetch_html(
     session: Any, url: str, timeout: int, headers: Dict[str, str]
-) -> str:
+) -> bytes:
     async with session.get(url, headers=headers, timeout=timeout) as resp:
         resp.raise_for_status()
-        return await resp.text()
+        return await resp.read()
+
+
+def _next_data_payload(html: bytes, url: str) -> bytes:
+    m = _NEXT_DATA_RE.search(html)
+    if not m:
+        raise ScrapeError(f"__NEXT_DATA__ not found for {url}")
+    return m.group(1)
+
+
+def _parse_next_data(html: bytes, url: str) -> Dict[str, Any]:
+    return _json_loads(_next_data_payload(html, url))
 
 
 async def _fetch_next_data(
-    session: Any, url: str, timeout: int, headers: Dict[str, str]
+    session: Any,
+    url: str,
+    timeout: int,
+    headers: Dict[str, str],
+    cache: Optional[_PageCache] = None,
 ) -> Dict[str, Any]:
-    html = await _fetch_html(session, url, timeout, headers)
-    soup = _beautiful_soup()(html, "html.parser")
-    node = soup.select_one("script#__NEXT_DATA__")
-    if not node or not node.string:
-        raise ScrapeError(f"__NEXT_DATA__ not found for {url}")
-    return json.loads(node.string)
+    if cache is None:
+        html = await _fetch_html(session, url, timeout, headers)
+        return _parse_next_data(html, url)
+
+    entry = cache.load(url)
+    if entry is None:
+        req_headers = headers
+    else:
+        if time.time() - entry.get("fetched_at", 0) < cache.ttl:
+            return _json_loads(entry["payload"])
+        req_headers = dict(headers)
+        if entry.get("etag"):
+            req_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            req_headers["If-Modified-Since"] = entry["last_modified"]
+
+    async with session.get(url, headers=req_headers, timeout=timeout) as resp:
+        if entry is not None and resp.status == 304:
+            # Unchanged: reuse the stored payload and restart its TTL.
+            payload = entry["payload"].encode("utf-8")
+            etag, last_modified = entry.get("etag"), entry.get("last_modified")
+        else:
+            resp.raise_for_status()
+            payload = _next_data_payload(await resp.read(), url)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+
+    cache.save(url, etag, last_modified, payload)
+    return _json_loads(payload)
 
 
 async def _fetch_next_data_from_candidates(
     session: Any,
-    urls: List[str],
+    urls: Sequence[str],
     timeout: int,
     headers: Dict[str, str],
     label: str,
 ) -> Tuple[Dict[str, Any], str]:
-    aiohttp = _aiohttp()
     last_err: Optional[Exception] = None
     attempts: List[str] = []
     for url in urls:
@@ -184,10 +306,10 @@ async def _fetch_next_data_from_candidates(
         except Exception as err:
             last_err = err
             attempts.append(f"{url}: {err}")
-            if isinstance(err, aiohttp.ClientResponseError) and err.status not in (403, 404):
+            if isinstance(err, _CLIENT_RESPONSE_ERROR) and err.status not in (403, 404):
                 raise
 
-    if isinstance(last_err, aiohttp.ClientResponseError) and last_err.status == 403:
+    if isinstance(last_err, _CLIENT_RESPONSE_ERROR) and last_err.status == 403:
         raise ScrapeError(
             f"{label} blocked with 403 on all known URLs. "
             "Cookie is likely expired or missing permissions."
@@ -199,12 +321,11 @@ async def _fetch_next_data_from_candidates(
 
 async def _fetch_html_from_candidates(
     session: Any,
-    urls: List[str],
+    urls: Sequence[str],
     timeout: int,
     headers: Dict[str, str],
     label: str,
-) -> Tuple[str, str]:
-    aiohttp = _aiohttp()
+) -> Tuple[bytes, str]:
     last_err: Optional[Exception] = None
     attempts: List[str] = []
     for url in urls:
@@ -213,7 +334,7 @@ async def _fetch_html_from_candidates(
         except Exception as err:
             last_err = err
             attempts.append(f"{url}: {err}")
-            if isinstance(err, aiohttp.ClientResponseError) and err.status not in (403, 404):
+            if isinstance(err, _CLIENT_RESPONSE_ERROR) and err.status not in (403, 404):
                 raise
 
     detail = "; ".join(attempts) if attempts else "no attempts made"
@@ -227,17 +348,22 @@ async def _fetch_model_metrics(
     title_hint: Optional[str],
     timeout: int,
     headers: Dict[str, str],
+    cache: Optional[_PageCache] = None,
 ) -> Dict[str, Any]:
     url = f"https://makerworld.com/en/models/{mid}-{slug}"
-    next_data = await _fetch_next_data(session, url, timeout, headers)
+    next_data = await _fetch_next_data(session, url, timeout, headers, cache)
     info = _best_model_info(next_data)
 
     metrics: Dict[str, Any] = {}
+    get = info.get
     for key in MODEL_METRIC_KEYS:
         if key in info:
-            value = info.get(key)
-            parsed = _coerce_int(value)
-            metrics[key] = parsed if parsed is not None else value
+            value = get(key)
+            if type(value) is not int:
+                parsed = _coerce_int(value)
+                if parsed is not None:
+                    value = parsed
+            metrics[key] = value
 
     return {
         "id": mid,
@@ -248,134 +374,159 @@ async def _fetch_model_metrics(
     }
 
 
+def create_session(concurrency: int) -> Any:
+    """Create a ClientSession whose pool allows ``concurrency`` connections."""
+    aiohttp = _aiohttp()
+    # Size the pool to the model fan-out in fetch_summary; idle connections
+    # are kept alive so later requests skip the TCP/TLS handshake.
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
 async def fetch_summary(
+    session: Any,
     user: str,
     cookie: str,
     user_agent: str,
     timeout: int,
     max_models: int,
+    concurrency: int = 8,
+    cache_dir: Optional[str] = None,
+    cache_ttl: float = 0,
 ) -> Dict[str, Any]:
     clean_user = user.lstrip("@")
+    # Only model pages are cached; profile stats should always be live.
+    cache = _PageCache(cache_dir, cache_ttl) if cache_dir else None
     headers = {"User-Agent": user_agent, "Cookie": _normalise_cookie(cookie)}
-    profile_urls = [
-        f"https://makerworld.com/en/@{clean_user}",
-        f"https://makerworld.com/@{clean_user}",
-    ]
-    upload_urls = [
-        f"https://makerworld.com/en/@{clean_user}/upload",
-        f"https://makerworld.com/@{clean_user}/upload",
-    ]
+    profile_urls, upload_urls = _urls_for(clean_user)
 
-    aiohttp = _aiohttp()
-    async with aiohttp.ClientSession() as session:
-        profile_nd, profile_url = await _fetch_next_data_from_candidates(
+    # The profile and upload pages are independent; fetch them together.
+    profile_res, upload_res = await asyncio.gather(
+        _fetch_next_data_from_candidates(
             session, profile_urls, timeout, headers, "profile"
-        )
+        ),
+        _fetch_html_from_candidates(
+            session, upload_urls, timeout, headers, "upload page"
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(profile_res, BaseException):
+        raise profile_res
+    profile_nd, profile_url = profile_res
+
+    user_info = _deep_get(profile_nd, _PATH_USER_INFO)
+    if not isinstance(user_info, dict):
+        raise ScrapeError("props.pageProps.userInfo not found")
+
+    points = (
+        user_info.get("point")
+        or user_info.get("points")
+        or user_info.get("pointCount")
+        or _deep_get(profile_nd, _PATH_SUMMARY_POINTS)
+    )
 
-        user_info = _deep_get(profile_nd, "props.pageProps.userInfo")
-        if not isinstance(user_info, dict):
-            raise ScrapeError("props.pageProps.userInfo not found")
+    summary = {
+        "Likes": user_info.get("likeCount"),
+        "Downloads": _deep_get(user_info, _PATH_MW_DOWNLOADS),
+        "Prints": _deep_get(user_info, _PATH_MW_PRINTS),
+        "Points": points,
+        "Followers": user_info.get("fanCount"),
+        "Boosts Received": user_info.get("boostGained"),
+    }
 
-        points = (
-            user_info.get("point")
-            or user_info.get("points")
-            or user_info.get("pointCount")
-            or _deep_get(profile_nd, "props.pageProps.summary.Points")
+    refs_html: Set[Tuple[int, str]] = set()
+    refs_nd: Dict[Tuple[int, str], Optional[str]] = {}
+    upload_error = None
+    upload_url = None
+    try:
+        if isinstance(upload_res, BaseException):
+            raise upload_res
+        # One download serves both the link scan and __NEXT_DATA__.
+        upload_html, upload_url = upload_res
+        refs_html = _collect_model_refs_from_upload_html(upload_html)
+        refs_nd = _collect_model_refs_from_next_data(
+            _parse_next_data(upload_html, upload_url)
         )
+    except Exception as err:
+        upload_error = str(err)
 
-        summary = {
-            "Likes": user_info.get("likeCount"),
-            "Downloads": _deep_get(user_info, "MWCount.myDesignDownloadCount"),
-            "Prints": _deep_get(user_info, "MWCount.myDesignPrintCount"),
-            "Points": points,
-            "Followers": user_info.get("fanCount"),
-            "Boosts Received": user_info.get("boostGained"),
-        }
-
-        refs_html: Set[Tuple[int, str]] = set()
-        refs_nd: Dict[Tuple[int, str], Optional[str]] = {}
-        upload_error = None
-        upload_url = None
-        try:
-            upload_html, upload_url = await _fetch_html_from_candidates(
-                session, upload_urls, timeout, headers, "upload page"
-            )
-            refs_html = _collect_model_refs_from_upload_html(upload_html)
-
-            upload_nd, upload_url = await _fetch_next_data_from_candidates(
-                session, upload_urls, timeout, headers, "upload data"
-            )
-            refs_nd = _collect_model_refs_from_next_data(upload_nd)
-        except Exception as err:
-            upload_error = str(err)
+    merged: Dict[Tuple[int, str], Optional[str]] = dict(refs_nd)
+    for mid, slug in refs_html:
+        merged.setdefault((mid, slug), None)
 
-        merged: Dict[Tuple[int, str], Optional[str]] = dict(refs_nd)
-        for mid, slug in refs_html:
-            merged.setdefault((mid, slug), None)
+    model_refs = list(merged.items())
+    model_refs.sort(key=lambda x: x[0][0])
+    if max_models > 0:
+        model_refs = model_refs[:max_models]
 
-        model_refs = list(merged.items())
-        model_refs.sort(key=lambda x: x[0][0])
-        if max_models > 0:
-            model_refs = model_refs[:max_models]
+    # Bound the fan-out here rather than only by the connection pool, so a
+    # request's timeout doesn't start running while it is still queued.
+    semaphore = asyncio.Semaphore(concurrency)
 
-        models: List[Dict[str, Any]] = []
-        for (mid, slug), title in model_refs:
+    async def fetch_one(mid: int, slug: str, title: Optional[str]) -> Dict[str, Any]:
+        async with semaphore:
             try:
-                metrics = await _fetch_model_metrics(
+                return await _fetch_model_metrics(
                     session,
                     mid=mid,
                     slug=slug,
                     title_hint=title,
                     timeout=timeout,
                     headers=headers,
+                    cache=cache,
                 )
-                models.append(metrics)
             except Exception as err:
-                models.append(
-                    {
-                        "id": mid,
-                        "slug": slug,
-                        "title": title,
-                        "error": str(err),
-                    }
-                )
-
-        top = {
-            "Most Liked Model": _top_by(models, "likeCount"),
-            "Most Downloaded Model": _top_by(models, "downloadCount"),
-            "Most Printed Model": _top_by(models, "printCount"),
-        }
+                return {
+                    "id": mid,
+                    "slug": slug,
+                    "title": title,
+                    "error": str(err),
+                }
+
+    # model_refs comes from a dict, so each (mid, slug) is fetched once.
+    models: List[Dict[str, Any]] = list(
+        await asyncio.gather(
+            *(fetch_one(mid, slug, title) for (mid, slug), title in model_refs)
+        )
+    )
 
-        diagnostics = {
-            "bannedPermission": user_info.get("bannedPermission"),
-            "handle": user_info.get("handle"),
-            "name": user_info.get("name"),
-            "uid": user_info.get("uid"),
-            "badges": user_info.get("badges"),
-            "certificated": user_info.get("certificated"),
-            "canSubscribeCommercialLicense": user_info.get("canSubscribeCommercialLicense"),
-            "designCount": _deep_get(user_info, "MWCount.designCount"),
-            "collectionCount": user_info.get("collectionCount"),
-            "downloadCount": user_info.get("downloadCount"),
-            "followCount": user_info.get("followCount"),
-            "featuredDesignCnt": user_info.get("featuredDesignCnt"),
-            "winContestTimes": user_info.get("winContestTimes"),
-        }
+    top = _top_models(models)
+
+    diagnostics = {
+        "bannedPermission": user_info.get("bannedPermission"),
+        "handle": user_info.get("handle"),
+        "name": user_info.get("name"),
+        "uid": user_info.get("uid"),
+        "badges": user_info.get("badges"),
+        "certificated": user_info.get("certificated"),
+        "canSubscribeCommercialLicense": user_info.get("canSubscribeCommercialLicense"),
+        "designCount": _deep_get(user_info, _PATH_MW_DESIGNS),
+        "collectionCount": user_info.get("collectionCount"),
+        "downloadCount": user_info.get("downloadCount"),
+        "followCount": user_info.get("followCount"),
+        "featuredDesignCnt": user_info.get("featuredDesignCnt"),
+        "winContestTimes": user_info.get("winContestTimes"),
+    }
 
-        return {
-            **summary,
-            "Top": top,
-            "Models": len(merged),
-            "Diagnostics": diagnostics,
-            "debug": {
-                "profile_url": profile_url,
-                "upload_url": upload_url,
-                "upload_error": upload_error,
-                "resolved_model_refs": len(model_refs),
-                "parsed_models": len(models),
-            },
-            "models": models,
-        }
+    return {
+        **summary,
+        "Top": top,
+        "Models": len(merged),
+        "Diagnostics": diagnostics,
+        "debug": {
+            "profile_url": profile_url,
+            "upload_url": upload_url,
+            "upload_error": upload_error,
+            "resolved_model_refs": len(model_refs),
+            "parsed_models": len(models),
+        },
+        "models": models,
+    }
 
 
 def _read_cookie(args: argparse.Namespace) -> str:
@@ -408,6 +559,13 @@ def _print_human(data: Dict[str, Any]) -> None:
     print(f"  parsed_models: {dbg.get('parsed_models')}")
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Debug MakerWorld scraping without HA restart.")
     parser.add_argument("--user", required=True, help="MakerWorld username (with or without @)")
@@ -420,6 +578,19 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--user-agent", default=DEFAULT_UA, help="User-Agent header")
     parser.add_argument("--timeout", type=int, default=20, help="HTTP timeout seconds")
     parser.add_argument("--max-models", type=int, default=0, help="0 = all")
+    parser.add_argument(
+        "--concurrency", type=_positive_int, default=8, help="Max simultaneous model page requests"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for cached model page data, revalidated with ETag/Last-Modified",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0,
+        help="Seconds to reuse cached model pages without revalidating (default 0)",
+    )
     parser.add_argument("--json", action="store_true", help="Print full JSON output")
     return parser.parse_args()
 
@@ -427,13 +598,18 @@ def parse_args() -> argparse.Namespace:
 async def _main_async(args: argparse.Namespace) -> int:
     try:
         cookie = _read_cookie(args)
-        data = await fetch_summary(
-            user=args.user,
-            cookie=cookie,
-            user_agent=args.user_agent,
-            timeout=args.timeout,
-            max_models=args.max_models,
-        )
+        async with create_session(args.concurrency) as session:
+            data = await fetch_summary(
+                session,
+                user=args.user,
+                cookie=cookie,
+                user_agent=args.user_agent,
+                timeout=args.timeout,
+                max_models=args.max_models,
+                concurrency=args.concurrency,
+                cache_dir=args.cache_dir,
+                cache_ttl=args.cache_ttl,
+            )
     except Exception as err:
         print(f"ERROR: {err}", file=sys.stderr)
         return 1
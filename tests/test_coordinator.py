@@ -0,0 +1,60 @@
+"""Tests for the MakerWorld coordinator's page parsing."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.makerworld.coordinator import (  # noqa: E402
+    _collect_upload_refs,
+    _parse_next_data,
+)
+
+NEXT_DATA = {"props": {"pageProps": {"userInfo": {"handle": "maker"}}}}
+
+
+def test_parse_next_data_regex() -> None:
+    body = (
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f"{json.dumps(NEXT_DATA)}</script>"
+    ).encode()
+
+    assert _parse_next_data(body, "https://makerworld.com/en/@maker") == NEXT_DATA
+
+
+def test_parse_next_data_soup_fallback() -> None:
+    # Single-quoted attributes don't match NEXT_DATA_RE, so this goes
+    # through the BeautifulSoup fallback.
+    body = (
+        "<script id='__NEXT_DATA__' type='application/json'>"
+        f"{json.dumps(NEXT_DATA)}</script>"
+    ).encode()
+
+    assert _parse_next_data(body, "https://makerworld.com/en/@maker") == NEXT_DATA
+
+
+def test_collect_upload_refs_merges_titles() -> None:
+    next_data = {"props": {"pageProps": {"designs": [{"id": 1, "slug": "cube", "title": "Cube"}]}}}
+    body = (
+        '<a href="/en/models/1-cube">Cube</a><a href="/en/models/2-vase">Vase</a>'
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f"{json.dumps(next_data)}</script>"
+    ).encode()
+
+    assert _collect_upload_refs(body, "https://makerworld.com/en/@maker/upload") == {
+        (1, "cube"): "Cube",
+        (2, "vase"): None,
+    }
+
+
+def test_collect_upload_refs_without_next_data() -> None:
+    # A missing __NEXT_DATA__ must not throw away the links on the page.
+    body = b'<a href="/en/models/1-cube">Cube</a><a href="/en/models/2-vase">Vase</a>'
+
+    assert _collect_upload_refs(body, "https://makerworld.com/en/@maker/upload") == {
+        (1, "cube"): None,
+        (2, "vase"): None,
+    }